@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Lightweight chart rendering for the benchmark comparison tool.
+
+Draws the grouped-bar comparison charts directly with Pillow primitives
+over an RGBA buffer, bypassing matplotlib's figure/axes/savefig pipeline
+entirely. Used by generate_comparison_charts.py when --engine=fast is
+selected; the scatter chart keeps the matplotlib path, where the vector
+aesthetics matter more than render time.
+"""
+
+from functools import lru_cache
+from PIL import Image, ImageDraw, ImageFont
+
+# Panel geometry (pixels); one panel per workload suite
+PANEL_WIDTH = 700
+PANEL_HEIGHT = 800
+MARGIN_LEFT = 90
+MARGIN_RIGHT = 30
+MARGIN_TOP = 130
+MARGIN_BOTTOM = 80
+
+BACKGROUND = (255, 255, 255, 255)
+AXIS_COLOR = (51, 51, 51, 255)
+GRID_COLOR = (210, 210, 210, 255)
+TEXT_COLOR = (40, 40, 40, 255)
+
+
+@lru_cache(maxsize=None)
+def _font(size):
+    """Load DejaVu Sans once per size (matches the matplotlib charts)"""
+    try:
+        return ImageFont.truetype('DejaVuSans.ttf', size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+def _hex_to_rgba(color):
+    """'#RRGGBB' -> (r, g, b, 255)"""
+    color = color.lstrip('#')
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4)) + (255,)
+
+
+def _text_size(draw, text, font):
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    return right - left, bottom - top
+
+
+def _draw_vertical_text(image, text, font, center_xy):
+    """Rotate a text label 90 degrees (PIL has no native rotated text)"""
+    probe = ImageDraw.Draw(image)
+    w, h = _text_size(probe, text, font)
+    label = Image.new('RGBA', (w + 4, h + 4), (0, 0, 0, 0))
+    ImageDraw.Draw(label).text((2, 2), text, font=font, fill=TEXT_COLOR)
+    label = label.rotate(90, expand=True)
+    cx, cy = center_xy
+    image.alpha_composite(label, (cx - label.width // 2, cy - label.height // 2))
+
+
+def _nice_ceiling(value):
+    """Round up to a tidy axis maximum (1/2/5 times a power of ten)"""
+    if value <= 0:
+        return 1.0
+    magnitude = 10 ** len(str(int(value))) / 10
+    for factor in (1, 2, 5, 10):
+        if value <= factor * magnitude:
+            return factor * magnitude
+    return 10 * magnitude
+
+
+def _draw_panel(image, draw, origin_x, panel_title, series, ylabel, fmt, y_max):
+    """Draw one suite panel: grouped bars with error whiskers and labels.
+
+    ``series`` maps architecture label -> (clients, means, errs, color),
+    with all architectures sharing the client-count groups.
+    """
+    plot_left = origin_x + MARGIN_LEFT
+    plot_right = origin_x + PANEL_WIDTH - MARGIN_RIGHT
+    plot_top = MARGIN_TOP
+    plot_bottom = PANEL_HEIGHT - MARGIN_BOTTOM
+    plot_w = plot_right - plot_left
+    plot_h = plot_bottom - plot_top
+
+    def y_pos(value):
+        return plot_bottom - int(plot_h * value / y_max)
+
+    # Gridlines and y tick labels
+    tick_font = _font(14)
+    for tick in range(5):
+        value = y_max * (tick + 1) / 5
+        y = y_pos(value)
+        draw.line([(plot_left, y), (plot_right, y)], fill=GRID_COLOR)
+        tick_label = f'{value:,.0f}' if y_max >= 10 else f'{value:.1f}'
+        tw, th = _text_size(draw, tick_label, tick_font)
+        draw.text((plot_left - tw - 8, y - th // 2), tick_label,
+                  font=tick_font, fill=TEXT_COLOR)
+
+    # Axes
+    draw.line([(plot_left, plot_top), (plot_left, plot_bottom)], fill=AXIS_COLOR, width=2)
+    draw.line([(plot_left, plot_bottom), (plot_right, plot_bottom)], fill=AXIS_COLOR, width=2)
+
+    # Bars, one group per client count
+    clients = next(iter(series.values()))[0]
+    n_groups = len(clients)
+    n_series = len(series)
+    slot = plot_w / max(n_groups, 1)
+    bar_w = int(slot * 0.8 / max(n_series, 1))
+    value_font = _font(13)
+
+    for s_idx, (label, (_, means, errs, color)) in enumerate(series.items()):
+        rgba = _hex_to_rgba(color)
+        for g_idx, (mean, err) in enumerate(zip(means, errs)):
+            x0 = int(plot_left + g_idx * slot + slot * 0.1 + s_idx * bar_w)
+            x1 = x0 + bar_w - 2
+            y0 = y_pos(mean)
+            draw.rectangle([x0, y0, x1, plot_bottom - 1], fill=rgba,
+                           outline=(255, 255, 255, 255))
+            # Error whisker with caps
+            if err > 0:
+                cx = (x0 + x1) // 2
+                y_lo, y_hi = y_pos(max(mean - err, 0)), y_pos(mean + err)
+                draw.line([(cx, y_hi), (cx, y_lo)], fill=AXIS_COLOR)
+                draw.line([(cx - 4, y_hi), (cx + 4, y_hi)], fill=AXIS_COLOR)
+                draw.line([(cx - 4, y_lo), (cx + 4, y_lo)], fill=AXIS_COLOR)
+            # Value label above the bar (or its whisker)
+            value_label = fmt % mean
+            tw, th = _text_size(draw, value_label, value_font)
+            label_y = y_pos(mean + err) - th - 4
+            draw.text(((x0 + x1) // 2 - tw // 2, label_y), value_label,
+                      font=value_font, fill=TEXT_COLOR)
+
+    # X tick labels and axis titles
+    label_font = _font(15)
+    for g_idx, client in enumerate(clients):
+        tick_label = str(client)
+        tw, th = _text_size(draw, tick_label, label_font)
+        draw.text((int(plot_left + g_idx * slot + slot / 2) - tw // 2,
+                   plot_bottom + 8), tick_label, font=label_font, fill=TEXT_COLOR)
+
+    xlabel = 'Number of Clients'
+    tw, _ = _text_size(draw, xlabel, label_font)
+    draw.text(((plot_left + plot_right) // 2 - tw // 2, plot_bottom + 34),
+              xlabel, font=label_font, fill=TEXT_COLOR)
+    _draw_vertical_text(image, ylabel, label_font,
+                        (origin_x + 22, (plot_top + plot_bottom) // 2))
+
+    # Panel title
+    title_font = _font(18)
+    tw, _ = _text_size(draw, panel_title, title_font)
+    draw.text(((plot_left + plot_right) // 2 - tw // 2, plot_top - 36),
+              panel_title, font=title_font, fill=TEXT_COLOR)
+
+
+def render_grouped_bars(panels, title, ylabel, fmt, outpath):
+    """Render one grouped-bar comparison image with one panel per suite.
+
+    ``panels`` is a list of (panel_title, series) pairs, where series maps
+    architecture label -> (clients, means, errs, color_hex). The image is
+    written as PNG with the fast (level 1, no optimize) encoder settings.
+    """
+    width = PANEL_WIDTH * max(len(panels), 1)
+    image = Image.new('RGBA', (width, PANEL_HEIGHT), BACKGROUND)
+    draw = ImageDraw.Draw(image)
+
+    # Shared y scale across panels so bars are visually comparable
+    y_max = _nice_ceiling(max(
+        (mean + err)
+        for _, series in panels
+        for _, means, errs, _ in series.values()
+        for mean, err in zip(means, errs)))
+
+    for idx, (panel_title, series) in enumerate(panels):
+        _draw_panel(image, draw, idx * PANEL_WIDTH, panel_title,
+                    series, ylabel, fmt, y_max)
+
+    # Figure title and legend (legend entries from the first panel)
+    title_font = _font(22)
+    for line_no, line in enumerate(title.split('\n')):
+        tw, _ = _text_size(draw, line, title_font)
+        draw.text((width // 2 - tw // 2, 14 + line_no * 28), line,
+                  font=title_font, fill=TEXT_COLOR)
+
+    legend_font = _font(15)
+    legend_x = width - 220
+    legend_y = 20
+    for label, (_, _, _, color) in panels[0][1].items():
+        draw.rectangle([legend_x, legend_y, legend_x + 18, legend_y + 14],
+                       fill=_hex_to_rgba(color), outline=AXIS_COLOR)
+        draw.text((legend_x + 26, legend_y - 1), label,
+                  font=legend_font, fill=TEXT_COLOR)
+        legend_y += 22
+
+    image.convert('RGB').save(outpath, optimize=False, compress_level=1)
+    return outpath